@@ -72,6 +72,9 @@ X_FRAME_OPTIONS = 'DENY'
 
 # STATIC
 # ------------------------
+# Hashed file names allow WhiteNoise to serve static files with far-future
+# cache headers. Files are served from STATIC_ROOT, the finders are only
+# used by "collectstatic" here.
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
 # MEDIA
@@ -119,7 +122,7 @@ vars().update(EMAIL_CONFIG)  # this sets all variables needed by Django
 # Anymail (Mailgun, PostMark and others)
 # ------------------------------------------------------------------------------
 # https://anymail.readthedocs.io/en/stable/installation/#installing-anymail
-# INSTALLED_APPS += ['anymail']  # noqa F405
+# INSTALLED_APPS += ('anymail',)  # noqa F405
 # EMAIL_BACKEND = 'anymail.backends.postmark.EmailBackend' # TODO there is also an entry in base.py, also use here?
 # ANYMAIL = {
 #     "POSTMARK_SERVER_TOKEN": env('POSTMARK_SERVER_TOKEN')
@@ -133,12 +136,12 @@ vars().update(EMAIL_CONFIG)  # this sets all variables needed by Django
 
 # Gunicorn
 # ------------------------------------------------------------------------------
-INSTALLED_APPS += ['gunicorn']  # noqa F405
+INSTALLED_APPS += ('gunicorn',)  # noqa F405
 
 # WhiteNoise
 # ------------------------------------------------------------------------------
 # http://whitenoise.evans.io/en/latest/django.html#enable-whitenoise
-MIDDLEWARE = ['whitenoise.middleware.WhiteNoiseMiddleware'] + MIDDLEWARE  # noqa F405
+MIDDLEWARE = ('whitenoise.middleware.WhiteNoiseMiddleware',) + MIDDLEWARE  # noqa F405
 
 
 # LOGGING
@@ -115,3 +115,20 @@ DATABASES = {
         # 'NAME': 'topobank.sqlite3',
     }
 }
+
+# FAST TESTS
+# ------------------------------------------------------------------------------
+# With TOPOBANK_FAST_TESTS=1 the test database is created directly from the
+# models instead of running all migrations (like pytest's --nomigrations),
+# and the debug output of our own loggers is skipped.
+# Tests of data migrations need the migrations, so this is opt-in.
+if env.bool('TOPOBANK_FAST_TESTS', default=False):
+    class _DisableMigrations:
+        def __contains__(self, app_label):
+            return True
+
+        def __getitem__(self, app_label):
+            return None
+
+    MIGRATION_MODULES = _DisableMigrations()
+    LOGGING['loggers']['topobank']['level'] = 'WARNING'
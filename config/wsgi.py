@@ -13,6 +13,7 @@ middleware here, or combine a Django application with an application of another
 framework.
 
 """
+import gc
 import os
 import sys
 
@@ -35,6 +36,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 # setting points here.
 application = get_wsgi_application()
 
+# Objects created during startup (settings, app registry, URL patterns, ...)
+# live as long as the process, so the garbage collector needn't scan them again
+gc.freeze()
+
 # Apply WSGI middleware here.
 # from helloworld.wsgi import HelloWorldApplication
 # application = HelloWorldApplication(application)
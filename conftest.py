@@ -15,6 +15,18 @@ _log = logging.getLogger(__name__)
 PASSWORD = "secret"
 
 
+@pytest.fixture(scope='session', autouse=True)
+def media_root(tmp_path_factory):
+    """Use a separate media directory for each pytest-xdist worker.
+
+    Otherwise workers running in parallel write files with the same names
+    to the shared MEDIA_ROOT and overwrite or delete each other's files.
+    """
+    from django.test import override_settings
+    with override_settings(MEDIA_ROOT=str(tmp_path_factory.mktemp('media'))):
+        yield
+
+
 @pytest.fixture
 def handle_usage_statistics():
     """This fixture is needed in the tests which affect usage statistics.
@@ -46,10 +58,15 @@ def user_bob():
 
 
 @pytest.fixture(scope='function')
-def user_alice_logged_in(live_server, browser, user_alice, handle_usage_statistics):
+def user_alice_logged_in(live_server, session_browser, user_alice, handle_usage_statistics):
     # passing "handle_usage_statistics" is important, otherwise
     # the following tests may fail in a strange way because of foreign key errors
 
+    # The browser is shared by all tests of the session, because starting
+    # it is much more expensive than the tests itself. Its state is reset
+    # after each test instead.
+    browser = session_browser
+
     #
     # Register all analysis functions
     #
@@ -71,16 +88,11 @@ def user_alice_logged_in(live_server, browser, user_alice, handle_usage_statisti
         yield browser, user_alice
     finally:
         #
-        # Logging out
-        #
+        # Logging out by dropping the session cookie,
         # important to have new session on next login
-        browser.find_by_id("userDropdown", wait_time=5).click()  # may cause problems..
-        browser.find_by_text("Sign Out").first.click()
-        browser.is_element_present_by_text("Ready to Leave?", wait_time=1)
-        browser.find_by_text("Sign Out").last.click()
-
-        browser.is_element_present_by_text('You have signed out.', wait_time=1)
-        browser.quit()
+        #
+        browser.cookies.delete()
+        browser.visit("about:blank")
 
         # remove session variables for user alice such these do no
         # affect subsequent tests
@@ -0,0 +1,13 @@
+import pathlib
+
+import pytest
+
+_SPLINTER_TESTS_DIR = pathlib.Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items):
+    # all tests in this directory need a browser and a live server,
+    # mark them such they can be run separately, e.g. with other options for pytest-xdist
+    for item in items:
+        if _SPLINTER_TESTS_DIR in pathlib.Path(item.fspath).parents:
+            item.add_marker(pytest.mark.splinter)
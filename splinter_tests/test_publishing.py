@@ -1,11 +1,12 @@
 import pytest
 
 from django.shortcuts import reverse
+from selenium.webdriver.common.by import By
 
 from topobank.manager.tests.utils import SurfaceFactory, Topography2DFactory
 from splinter_tests.utils import goto_select_page, goto_publications_page, \
     select_sharing_status, press_view_for_item_by_name, num_items_in_result_table, \
-    data_of_item_by_name
+    data_of_item_by_name, wait_for_css, wait_for_url
 
 
 def press_yes_publish(browser):
@@ -15,7 +16,8 @@ def press_yes_publish(browser):
 
 def press_permissions(browser):
     browser.links.find_by_partial_text("Permissions").first.click()
-    assert browser.is_text_present("Users having permissions regarding this surface.", wait_time=1)
+    wait_for_css(browser, '#permissions td')
+    assert browser.is_text_present("Users having permissions regarding this surface.")
 
 
 def assert_only_permissions_everyone(browser):
@@ -30,6 +32,15 @@ def select_radio_btn(browser, radio_id):
     browser.execute_script("arguments[0].click();", radio_btn._element)
 
 
+def open_versions_dropdown(browser):
+    """Open dropdown for versions and return the links to the versions.
+
+    The links are Selenium web elements, found with a single request to the driver.
+    """
+    browser.find_by_id('versions-btn').click()
+    return browser.driver.find_elements(By.CSS_SELECTOR, '#versions-dropdown a')
+
+
 def press_insert_me_btn(browser, index=0):
     insert_me_btn = browser.find_by_css('.insert-me-btn')[index]
     insert_me_btn.click()
@@ -111,8 +122,9 @@ def test_publishing_form(user_alice_logged_in, handle_usage_statistics):
     # The extra tab is closed and Alice is taken
     # to the list of published surfaces.
     press_yes_publish(browser)
-    assert len(browser.find_by_name("save")) == 0
-    assert browser.is_text_present("Surfaces published by you", wait_time=1)
+    wait_for_url(browser, reverse('manager:publications'))
+    assert browser.is_element_not_present_by_name("save", wait_time=0)
+    assert browser.is_text_present("Surfaces published by you")
 
     # Here the published surface is listed. Also the author names are listed, here just Alice' name.
     # Alice presses the link and enters the property page for the surface.
@@ -185,8 +197,9 @@ def test_publishing_form_multiple_authors(user_alice_logged_in, handle_usage_sta
     select_radio_btn(browser, 'id_agreed')
 
     press_yes_publish(browser)
-    assert len(browser.find_by_name("save")) == 0
-    assert browser.is_text_present("Surfaces published by you", wait_time=1)
+    wait_for_url(browser, reverse('manager:publications'))
+    assert browser.is_element_not_present_by_name("save", wait_time=0)
+    assert browser.is_text_present("Surfaces published by you")
 
     # Here the published surface is listed. And both author names.
     assert browser.is_text_present(surface_name)
@@ -262,22 +275,18 @@ def test_see_published_by_others(user_alice_logged_in, user_bob, handle_usage_st
     #
     # Alice can switch to the new version
     #
-    versions_btn = browser.find_by_id('versions-btn')
-    versions_btn.click()
-    versions_dropdown = browser.find_by_id('versions-dropdown')
-    version_links = versions_dropdown.find_by_tag('a')
+    version_links = open_versions_dropdown(browser)
 
     assert "Version 1" in version_links[0].text
     assert "Version 2" in version_links[1].text
 
     version_links[1].click()
 
-    assert browser.is_text_present(f"{publication.original_surface.label}", wait_time=1)
-
     #
     # Alice should be on the page of the new version
     #
-    assert publication.surface.get_absolute_url() in browser.url
+    wait_for_url(browser, publication.surface.get_absolute_url())
+    assert browser.is_text_present(f"{publication.original_surface.label}")
 
 
 @pytest.mark.django_db
@@ -306,22 +315,18 @@ def test_switch_between_wip_and_version(user_alice_logged_in, handle_usage_stati
     #
     # Switching to version 1
     #
-    versions_btn = browser.find_by_id('versions-btn')
-    versions_btn.click()
-    versions_dropdown = browser.find_by_id('versions-dropdown')
-    version_links = versions_dropdown.find_by_tag('a')
+    version_links = open_versions_dropdown(browser)
 
     assert "Work in progress" in version_links[0].text
     assert "Version 1" in version_links[1].text
 
     version_links[1].click()
 
-    assert browser.is_text_present(f"{publication.surface.label}", wait_time=1)
-
     #
     # Alice should be on the page of the new version
     #
-    assert publication.surface.get_absolute_url() in browser.url
+    wait_for_url(browser, publication.surface.get_absolute_url())
+    assert browser.is_text_present(f"{publication.surface.label}")
 
     # She cannot edit
     assert not browser.is_text_present("Edit meta data")
@@ -329,18 +334,15 @@ def test_switch_between_wip_and_version(user_alice_logged_in, handle_usage_stati
     #
     # Alice can switch back to editable version (work in progress)
     #
-    versions_btn = browser.find_by_id('versions-btn')
-    versions_btn.click()
-    versions_dropdown = browser.find_by_id('versions-dropdown')
-    version_links = versions_dropdown.find_by_tag('a')
+    version_links = open_versions_dropdown(browser)
 
     assert "Work in progress" in version_links[0].text
     assert "Version 1" in version_links[1].text
 
     version_links[0].click()
 
-    assert browser.is_text_present(f"{publication.original_surface.label}", wait_time=1)
-    assert publication.original_surface.get_absolute_url() in browser.url
+    wait_for_url(browser, publication.original_surface.get_absolute_url())
+    assert browser.is_text_present(f"{publication.original_surface.label}")
 
     assert browser.is_text_present("Edit meta data")
 
@@ -1,4 +1,24 @@
+from urllib.parse import urljoin
+
+from django.shortcuts import reverse
+from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def wait_for_css(browser, selector, timeout=2):
+    """Wait until an element matching the given CSS selector is present.
+
+    Returns as soon as the element is there, use this instead of
+    polling for some text after actions which load a new page.
+    """
+    WebDriverWait(browser.driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+
+
+def wait_for_url(browser, url_part, timeout=2):
+    """Wait until the current URL of the browser contains the given string."""
+    WebDriverWait(browser.driver, timeout).until(EC.url_contains(url_part))
 
 
 def search_for(browser, search_term):
@@ -127,9 +147,17 @@ def select_tree_mode(browser, mode):
     assert browser.is_text_present('top level tags', wait_time=1)
 
 
+#
+# Navigation helpers load pages by their URL instead of clicking on links
+# in the navigation, this saves looking up the link in the browser
+#
+def visit_path(browser, path):
+    """Load page with given path from the server the browser is currently connected to."""
+    browser.visit(urljoin(browser.url, path))
+
+
 def goto_publications_page(browser):
-    link = browser.find_link_by_partial_href('publications')
-    link.click()
+    visit_path(browser, reverse('manager:publications'))
 
 
 def goto_sharing_page(browser):
@@ -139,8 +167,7 @@ def goto_sharing_page(browser):
 
 
 def goto_select_page(browser):
-    select_link = browser.find_link_by_partial_text('Find & select')
-    select_link.click()
+    visit_path(browser, reverse('manager:select'))
     assert browser.is_text_present("Showing")
 
 
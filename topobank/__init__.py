@@ -1,7 +1,2 @@
 __version__ = "0.10.1"
-__version_info__ = tuple(
-    [
-        int(num) if num.isdigit() else num
-        for num in __version__.replace("-", ".", 1).split(".")
-    ]
-)
+__version_info__ = (0, 10, 1)  # keep in sync with __version__, see tests/test_version_info.py
@@ -1,5 +1,8 @@
-from django.http import HttpResponse, HttpResponseForbidden, HttpResponseBadRequest
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseBadRequest, Http404, \
+    StreamingHttpResponse
 from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 
 import pandas as pd
 import io
@@ -8,8 +11,12 @@ import numpy as np
 import zipfile
 import os.path
 import textwrap
+from collections import defaultdict
 
-from .models import Analysis
+from ..manager.models import Topography, Surface
+from ..manager.utils import surfaces_for_user
+
+from .models import Analysis, Version
 from .views import CARD_VIEW_FLAVORS
 from .utils import mangle_sheet_name
 
@@ -17,7 +24,12 @@ from .utils import mangle_sheet_name
 # Download views
 #######################################################################
 
+# Versions of dependencies ordered by name, as listed in the downloads
+_VERSIONS_PREFETCH = Prefetch('configuration__versions',
+                              queryset=Version.objects.select_related('dependency').order_by('dependency__import_name'))
+
 
+@transaction.non_atomic_requests
 def download_analyses(request, ids, card_view_flavor, file_format):
     """Returns a file comprised from analyses results.
 
@@ -37,18 +49,31 @@ def download_analyses(request, ids, card_view_flavor, file_format):
 
     analyses_ids = [int(i) for i in ids.split(',')]
 
-    analyses = []
+    # Fetch all analyses at once, together with their functions, subjects and versions
+    analyses_by_id = Analysis.objects.select_related('function', 'subject_type', 'configuration')\
+        .prefetch_related('subject', _VERSIONS_PREFETCH).in_bulk(analyses_ids)
 
-    for aid in analyses_ids:
-        analysis = Analysis.objects.get(id=aid)
+    # Also fetch the related surfaces and their publications, which are needed
+    # for permissions and publication links; subjects may be surfaces or topographies
+    subjects = [a.subject for a in analyses_by_id.values()]
+    prefetch_related_objects([s for s in subjects if isinstance(s, Topography)], 'surface__publication')
+    prefetch_related_objects([s for s in subjects if isinstance(s, Surface)], 'publication')
 
-        #
-        # Check whether user has view permission for requested analysis
-        #
-        if not analysis.is_visible_for_user(user):
-            return HttpResponseForbidden()
+    analyses = []
+    for aid in analyses_ids:
+        try:
+            analyses.append(analyses_by_id[aid])
+        except KeyError:
+            raise Http404(f"Analysis {aid} does not exist.")
 
-        analyses.append(analysis)
+    #
+    # Check whether user has view permission for all requested analyses,
+    # using one query for all related surfaces
+    #
+    surface_ids = {a.related_surface.id for a in analyses}
+    visible_surface_ids = set(surfaces_for_user(user).filter(id__in=surface_ids).values_list('id', flat=True))
+    if surface_ids != visible_surface_ids:
+        return HttpResponseForbidden()
 
     #
     # Check flavor and format argument
@@ -76,6 +101,13 @@ def download_analyses(request, ids, card_view_flavor, file_format):
     return download_response_functions[key](request, analyses)
 
 
+# Properties listed for every analysis on the meta data sheet, in this order
+_ANALYSIS_META_DATA_PROPERTIES = ('Subject Type', 'Subject Name',
+                                  'Creator',
+                                  'Further arguments of analysis function', 'Start time of analysis task',
+                                  'End time of analysis task', 'Duration of analysis task')
+
+
 def _analyses_meta_data_dataframe(analyses, request):
     """Generates a pandas.DataFrame with meta data about analyses.
 
@@ -91,47 +123,38 @@ def _analyses_meta_data_dataframe(analyses, request):
     pandas.DataFrame, can be inserted as extra sheet
     """
 
-    properties = []
-    values = []
+    rows = []  # (property, value) tuples
     for i, analysis in enumerate(analyses):
 
         surface = analysis.related_surface
         pub = surface.publication if surface.is_published else None
 
         if i == 0:
-            properties = ["Function"]
-            values = [str(analysis.function)]
+            rows.append(("Function", str(analysis.function)))
 
-        properties += ['Subject Type', 'Subject Name',
-                       'Creator',
-                       'Further arguments of analysis function', 'Start time of analysis task',
-                       'End time of analysis task', 'Duration of analysis task']
-
-        values += [str(analysis.subject.get_content_type().model), str(analysis.subject.name),
-                   str(analysis.subject.creator),
-                   analysis.get_kwargs_display(), str(analysis.start_time),
-                   str(analysis.end_time), str(analysis.duration())]
+        rows.extend(zip(_ANALYSIS_META_DATA_PROPERTIES,
+                        (str(analysis.subject_type.model), str(analysis.subject.name),
+                         str(analysis.subject.creator),
+                         analysis.get_kwargs_display(), str(analysis.start_time),
+                         str(analysis.end_time), str(analysis.duration()))))
 
         if analysis.configuration is None:
-            properties.append("Versions of dependencies")
-            values.append("Unknown. Please recalculate this analysis in order to have version information here.")
+            rows.append(("Versions of dependencies",
+                         "Unknown. Please recalculate this analysis in order to have version information here."))
         else:
-            versions_used = analysis.configuration.versions.order_by('dependency__import_name')
+            versions_used = analysis.configuration.versions.all()  # ordered, see _VERSIONS_PREFETCH
 
-            for version in versions_used:
-                properties.append(f"Version of '{version.dependency.import_name}'")
-                values.append(f"{version.number_as_string()}")
+            rows.extend((f"Version of '{version.dependency.import_name}'", f"{version.number_as_string()}")
+                        for version in versions_used)
 
         if pub:
             # If the surface of the topography was published, the URL is inserted
-            properties.append("Publication URL (surface data)")
-            values.append(request.build_absolute_uri(pub.get_absolute_url()))
+            rows.append(("Publication URL (surface data)", request.build_absolute_uri(pub.get_absolute_url())))
 
         # We want an empty line on the properties sheet in order to distinguish the topographies
-        properties.append("")
-        values.append("")
+        rows.append(("", ""))
 
-    df = pd.DataFrame({'Property': properties, 'Value': values})
+    df = pd.DataFrame(rows, columns=['Property', 'Value'])
 
     return df
 
@@ -149,15 +172,11 @@ def _publications_urls(request, analyses):
     -------
     Set of absolute URLs (strings)
     """
-    # Collect publication links, if any
-    publication_urls = set()
-    for a in analyses:
-        surface = a.related_surface
-        if surface.is_published:
-            pub = surface.publication
-            pub_url = request.build_absolute_uri(pub.get_absolute_url())
-            publication_urls.add(pub_url)
-    return publication_urls
+    # Collect publication links, if any; several analyses often belong to the same surface,
+    # so each URL is only built once per surface
+    surfaces = {a.related_surface for a in analyses}
+    return {request.build_absolute_uri(surface.publication.get_absolute_url())
+            for surface in surfaces if surface.is_published}
 
 
 def _analysis_header_for_txt_file(analysis, as_comment=True):
@@ -191,7 +210,7 @@ def _analysis_header_for_txt_file(analysis, as_comment=True):
         s += 'Versions of dependencies (like "SurfaceTopography") are unknown for this analysis.\n'
         s += 'Please recalculate in order to have version information here.\n'
     else:
-        versions_used = analysis.configuration.versions.order_by('dependency__import_name')
+        versions_used = analysis.configuration.versions.all()  # ordered, see _VERSIONS_PREFETCH
 
         for version in versions_used:
             s += f"Version of '{version.dependency.import_name}': {version.number_as_string()}\n"
@@ -204,18 +223,18 @@ def _analysis_header_for_txt_file(analysis, as_comment=True):
 
 
 def download_plot_analyses_to_txt(request, analyses):
-    """Download plot data for given analyses as CSV file.
+    """Download plot data for given analyses as text file.
 
-        Parameters
-        ----------
-        request
-            HTTPRequest
-        analyses
-            Sequence of Analysis instances
+    Parameters
+    ----------
+    request
+        HTTPRequest
+    analyses
+        Sequence of Analysis instances
 
-        Returns
-        -------
-        HTTPResponse
+    Returns
+    -------
+    HTTPResponse
     """
     # TODO: It would probably be useful to use the (some?) template engine for this.
     # TODO: We need a mechanism for embedding references to papers into output.
@@ -223,12 +242,54 @@ def download_plot_analyses_to_txt(request, analyses):
     # Collect publication links, if any
     publication_urls = _publications_urls(request, analyses)
 
-    # Pack analysis results into a single text file.
-    f = io.StringIO()
-    for i, analysis in enumerate(analyses):
+    # Check for results and get everything needed from the database before the
+    # response is started, so that failures lead to an error response instead of
+    # a truncated file. The results are only unpickled while streaming, one
+    # at a time, so that they are not all held in memory at once.
+    headers = []
+    pickled_results = []
+    for analysis in analyses:
+        if not analysis.result:
+            return HttpResponseBadRequest(f"Analysis {analysis.id} has no result to download.")
+        headers.append(_analysis_header_for_txt_file(analysis))
+        pickled_results.append(analysis.result)
+
+    function = analyses[0].function
+    response = StreamingHttpResponse(_plot_analyses_txt_chunks(function, publication_urls, headers, pickled_results),
+                                     content_type='application/text')
+    filename = '{}.txt'.format(function.name).replace(' ', '_')
+    response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
+
+    return response
+
+
+def _plot_analyses_txt_chunks(function, publication_urls, headers, pickled_results):
+    """Generate the text file for plot analyses, one chunk per analysis.
+
+    Only formats the given data, it must not access the database,
+    because the response has already been started when this runs.
+
+    Parameters
+    ----------
+    function
+        AnalysisFunction instance of all analyses
+    publication_urls
+        set of absolute publication URLs
+    headers
+        list of str, header for each analysis, see _analysis_header_for_txt_file
+    pickled_results
+        list of bytes, pickled result for each analysis
+
+    Returns
+    -------
+    Generator of str
+    """
+    for i, (analysis_header, pickled_result) in enumerate(zip(headers, pickled_results)):
+        result = pickle.loads(pickled_result)
+        f = io.StringIO()
         if i == 0:
-            f.write('# {}\n'.format(analysis.function) +
-                    '# {}\n'.format('=' * len(str(analysis.function))))
+            f.write('# {}\n'.format(function) +
+                    '# {}\n'.format('=' * len(str(function))))
 
             f.write('# IF YOU USE THIS DATA IN A PUBLICATION, PLEASE CITE XXX.\n' +
                     '\n')
@@ -239,9 +300,8 @@ def download_plot_analyses_to_txt(request, analyses):
                     f.write(f'# - {pub_url}\n')
                 f.write('#\n')
 
-        f.write(_analysis_header_for_txt_file(analysis))
+        f.write(analysis_header)
 
-        result = pickle.loads(analysis.result)
         xunit_str = '' if result['xunit'] is None else ' ({})'.format(result['xunit'])
         yunit_str = '' if result['yunit'] is None else ' ({})'.format(result['yunit'])
         header = 'Columns: {}{}, {}{}'.format(result['xlabel'], xunit_str, result['ylabel'], yunit_str)
@@ -254,23 +314,19 @@ def download_plot_analyses_to_txt(request, analyses):
                 '# could be computed because the average contains only a single data point.\n\n'])
 
         for series in result['series']:
-            series_data = [series['x'], series['y']]
-            try:
-                series_data.append(series['std_err_y'].filled(np.nan))
-            except KeyError:
-                pass
-            np.savetxt(f, np.transpose(series_data),
+            # Fill the columns of one row-major array, which is written row by row
+            has_std_err_y = 'std_err_y' in series
+            series_data = np.empty((len(series['x']), 3 if has_std_err_y else 2))
+            series_data[:, 0] = series['x']
+            series_data[:, 1] = series['y']
+            if has_std_err_y:
+                series_data[:, 2] = series['std_err_y'].filled(np.nan)
+            np.savetxt(f, series_data,
                        header='{}\n{}\n{}'.format(series['name'], '-' * len(series['name']), header))
             f.write('\n')
 
-    # Prepare response object.
-    response = HttpResponse(f.getvalue(), content_type='application/text')
-    filename = '{}.txt'.format(analysis.function.name).replace(' ', '_')
-    response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
-
-    # Close file and return response.
-    f.close()
-    return response
+        yield f.getvalue()
+        f.close()
 
 
 def download_plot_analyses_to_xlsx(request, analyses):
@@ -297,27 +353,28 @@ def download_plot_analyses_to_xlsx(request, analyses):
     # which can be used in sheet names if subject names are not unique
     subject_names_in_sheet_names = [a.subject.name for a in analyses]
 
-    for sn in set(subject_names_in_sheet_names):  # iterate over distinct names
+    indices_by_name = defaultdict(list)  # distinct name -> indices of analyses with this subject name
+    for i, sn in enumerate(subject_names_in_sheet_names):
+        indices_by_name[sn].append(i)
 
+    for indices in indices_by_name.values():
         # replace name with a unique one using a counter
-        indices = [i for i, a in enumerate(analyses) if a.subject.name == sn]
-
         if len(indices) > 1:  # only rename if not unique
             for k, idx in enumerate(indices):
                 subject_names_in_sheet_names[idx] += f" ({k + 1})"
 
-    def comment_on_average(y, std_err_y_masked):
-        """Calculate a comment.
+    def comments_on_average(y, std_err_y_mask):
+        """Calculate a comment for each data point.
 
         Parameters:
-            y: float
-            std_err_y_masked: boolean
+            y: array of floats
+            std_err_y_mask: array of booleans, True where no error is available
         """
-        if np.isnan(y):
-            return 'average could not be computed'
-        elif std_err_y_masked:
-            return 'no error could be computed because the average contains only a single data point'
-        return ''
+        # An object array is used by pandas as is, a fixed width string array would be converted
+        comments = np.full(len(y), '', dtype=object)
+        comments[std_err_y_mask] = 'no error could be computed because the average contains only a single data point'
+        comments[np.isnan(y)] = 'average could not be computed'  # takes precedence
+        return comments
 
     for i, analysis in enumerate(analyses):
         result = pickle.loads(analysis.result)
@@ -330,8 +387,8 @@ def download_plot_analyses_to_xlsx(request, analyses):
             df_columns_dict = {column1: series['x'], column2: series['y']}
             try:
                 df_columns_dict[column3] = series['std_err_y']
-                df_columns_dict[column4] = [comment_on_average(y, masked)
-                                            for y, masked in zip(series['y'], series['std_err_y'].mask)]
+                df_columns_dict[column4] = comments_on_average(np.asarray(series['y'], dtype=float),
+                                                               np.ma.getmaskarray(series['std_err_y']))
             except KeyError:
                 pass
             df = pd.DataFrame(df_columns_dict)
@@ -9,8 +9,8 @@ from django.conf import settings
 
 import xarray as xr
 import numpy as np
+import math
 import tempfile
-from pint import UnitRegistry, UndefinedUnitError
 from scipy.interpolate import interp1d
 import scipy.stats
 
@@ -19,6 +19,7 @@ from ContactMechanics import PeriodicFFTElasticHalfSpace, FreeFFTElasticHalfSpac
 
 import topobank.manager.models  # will be used to evaluate model classes
 from .registry import AnalysisFunctionRegistry
+from .utils import unit_conversion_factor
 
 GAUSSIAN_FIT_SERIES_NAME = 'Gaussian fit'
 
@@ -55,11 +56,13 @@ def _reasonable_bins_argument(topography):
     :param topography: Line scan or topography from SurfaceTopography module
     :return: argument for 'bins' argument of np.histogram
     """
-    if topography.is_uniform:
-        return int(np.sqrt(np.prod(topography.nb_grid_pts)) + 1.0)
-    else:
-        return int(np.sqrt(np.prod(len(topography.positions()))) + 1.0)  # TODO discuss whether auto or this
-        # return 'auto'
+    # For nonuniform line scans, nb_grid_pts is the number of positions, so
+    # there is no need to build the positions array just to count them
+    nb_points = 1
+    for n in topography.nb_grid_pts:  # small tuple of ints, no need for numpy here
+        nb_points *= n
+    return int(math.sqrt(nb_points) + 1.0)  # TODO discuss whether auto or this
+    # return 'auto'
 
 
 class IncompatibleTopographyException(Exception):
@@ -537,7 +540,6 @@ def average_results_for_surface(surface, topo_analysis_func, num_points=100,
 
     topo_result_series = {}  # key: series name, value: list of dict's, one for each result series
 
-    ureg = UnitRegistry()
     xunit = None
     yunit = None
 
@@ -558,8 +560,8 @@ def average_results_for_surface(surface, topo_analysis_func, num_points=100,
             xunit_factor = 1
             yunit_factor = 1
         else:
-            xunit_factor = ureg.convert(1, topo_result['xunit'], xunit)
-            yunit_factor = ureg.convert(1, topo_result['yunit'], yunit)
+            xunit_factor = unit_conversion_factor(topo_result['xunit'], xunit)
+            yunit_factor = unit_conversion_factor(topo_result['yunit'], yunit)
 
         for s in topo_result['series']:
             series_name = s['name']
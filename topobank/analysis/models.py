@@ -5,6 +5,7 @@ from django.db import models
 from django.db.models import CheckConstraint, Q, UniqueConstraint
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.utils.functional import cached_property
 
 import inspect
 import pickle
@@ -141,9 +142,12 @@ class Analysis(models.Model):
         """
         return "analyses/{}/".format(self.id)
 
-    @property
+    @cached_property
     def related_surface(self):
-        """Returns surface instance related to this analysis."""
+        """Returns surface instance related to this analysis.
+
+        The subject of an analysis does not change, so the surface is only determined once per instance.
+        """
         subject = self.subject
         if hasattr(subject, 'surface'):
             surface = subject.surface
@@ -159,15 +163,15 @@ class Analysis(models.Model):
     def is_topography_related(self):
         """Returns True, if analysis is related to a specific topography, else False.
         """
-        topography_ct = ContentType.objects.get_by_natural_key('manager', 'topography')
-        return topography_ct == self.subject_type
+        topography_ct = ContentType.objects.get_by_natural_key('manager', 'topography')  # cached by Django
+        return topography_ct.id == self.subject_type_id  # no need to fetch the analysis' subject type
 
     @property
     def is_surface_related(self):
         """Returns True, if analysis is related to a specific surface, else False.
         """
-        surface_ct = ContentType.objects.get_by_natural_key('manager', 'surface')
-        return surface_ct == self.subject_type
+        surface_ct = ContentType.objects.get_by_natural_key('manager', 'surface')  # cached by Django
+        return surface_ct.id == self.subject_type_id  # no need to fetch the analysis' subject type
 
 
 class AnalysisFunction(models.Model):
@@ -211,11 +215,12 @@ class AnalysisFunction(models.Model):
         -------
         AnalysisFunctionImplementation instance
         """
-        try:
-            impl = self.implementations.get(subject_type=subject_type)
-        except AnalysisFunctionImplementation.DoesNotExist as exc:
-            raise ImplementationMissingException(self.name, subject_type)
-        return impl
+        # Looping over all implementations (there are only few) instead of filtering
+        # makes use of implementations prefetched with prefetch_related('implementations')
+        for impl in self.implementations.all():
+            if impl.subject_type_id == subject_type.id:
+                return impl
+        raise ImplementationMissingException(self.name, subject_type)
 
     def python_function(self, subject_type):
         """Return function for given first argument type.
@@ -482,7 +482,7 @@ def test_analysis_download_as_txt(client, two_topos, ids_downloadable_analyses,
 
     from io import StringIO
 
-    txt = response.content.decode()
+    txt = b''.join(response.streaming_content).decode()
 
     assert "Test Function" in txt  # function name should be in there
 
@@ -539,6 +539,23 @@ def test_analysis_download_as_txt(client, two_topos, ids_downloadable_analyses,
     assert arr == pytest.approx(expected_arr)
 
 
+@pytest.mark.django_db
+def test_analysis_download_as_txt_without_result(client, two_topos, ids_downloadable_analyses,
+                                                 handle_usage_statistics):
+    # The text download is streamed, so missing results must be detected before
+    # the response is started, otherwise the user gets a truncated file
+    Analysis.objects.filter(id=ids_downloadable_analyses[-1]).update(result=None)
+
+    assert client.login(username='testuser', password='abcd$1234')
+
+    ids_str = ",".join(str(i) for i in ids_downloadable_analyses)
+    download_url = reverse('analysis:download', kwargs=dict(ids=ids_str, card_view_flavor='plot', file_format='txt'))
+
+    response = client.get(download_url)
+    assert response.status_code == 400
+    assert not response.streaming
+
+
 @pytest.mark.parametrize('file_format', ['txt', 'xlsx'])
 @pytest.mark.django_db
 def test_roughness_params_download_as_txt(client, two_topos, file_format, handle_usage_statistics):
@@ -877,7 +894,7 @@ def test_publication_link_in_txt_download(client, two_analyses_two_publications,
     response = client.get(download_url)
     assert response.status_code == 200
 
-    txt = response.content.decode()
+    txt = b''.join(response.streaming_content).decode()
 
     assert pub1.get_absolute_url() in txt
     assert pub2.get_absolute_url() in txt
@@ -2,10 +2,12 @@ import pytest
 import pickle
 import math
 import datetime
+from pint import UndefinedUnitError
 from django.contrib.contenttypes.models import ContentType
 
 from topobank.analysis.models import Analysis, AnalysisFunction
-from topobank.analysis.utils import mangle_sheet_name, request_analysis, round_to_significant_digits
+from topobank.analysis.utils import mangle_sheet_name, request_analysis, round_to_significant_digits, \
+    unit_conversion_factor
 from topobank.analysis.tests.utils import TopographyAnalysisFactory, AnalysisFunctionFactory
 from topobank.manager.tests.utils import UserFactory
 from topobank.manager.models import Topography
@@ -161,3 +163,12 @@ def test_round_to_significant_digits(x, num_sig_digits, rounded):
         assert math.isnan(round_to_significant_digits(x, num_sig_digits))
     else:
         assert math.isclose(round_to_significant_digits(x, num_sig_digits), rounded, abs_tol=1e-20)
+
+
+def test_unit_conversion_factor():
+    assert math.isclose(unit_conversion_factor('nm', 'µm'), 1e-3)
+    assert math.isclose(unit_conversion_factor('µm', 'nm'), 1e3)
+    assert unit_conversion_factor('m', 'm') == 1
+
+    with pytest.raises(UndefinedUnitError):
+        unit_conversion_factor('m', 'unknown_unit')
@@ -3,7 +3,9 @@ from django.db import transaction
 from django.db.models import Q
 from django.contrib.contenttypes.models import ContentType
 from guardian.shortcuts import get_users_with_perms
+from pint import UnitRegistry
 
+from functools import lru_cache
 import inspect
 import pickle
 import math
@@ -122,7 +124,7 @@ def renew_analyses_for_subject(subject):
     """
     from topobank.manager.models import Surface
 
-    analysis_funcs = AnalysisFunction.objects.all()
+    analysis_funcs = AnalysisFunction.objects.prefetch_related('implementations')
 
     # collect users which are allowed to view analyses
     related_surface = subject if isinstance(subject, Surface) else subject.surface
@@ -313,6 +315,36 @@ def mangle_sheet_name(s: str) -> str:
 
     return s
 
+
+@lru_cache(maxsize=None)
+def _unit_registry():
+    """Return the unit registry shared by all unit conversions.
+
+    Building a registry parses pint's unit definitions, so this is done once per process.
+    """
+    return UnitRegistry()
+
+
+@lru_cache(maxsize=256)
+def unit_conversion_factor(from_unit, to_unit):
+    """Return factor for converting values from one unit to another.
+
+    Parameters
+    ----------
+    from_unit: str
+        Unit of given values, e.g. 'nm'
+    to_unit: str
+        Unit to convert to, e.g. 'µm'
+
+    Returns
+    -------
+    float
+
+    Raises pint.UndefinedUnitError if one of the units is unknown.
+    """
+    return _unit_registry().convert(1, from_unit, to_unit)
+
+
 def round_to_significant_digits(x, num_dig_digits):
     """Round given number to given number of significant digits
 
@@ -16,6 +16,7 @@ from django import template
 from django.core.files.storage import default_storage
 from django.core.cache import cache  # default cache
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.shortcuts import reverse
 from django.conf import settings
 
@@ -33,7 +34,7 @@ from bokeh.models.formatters import FuncTickFormatter
 
 import xarray as xr
 
-from pint import UnitRegistry, UndefinedUnitError
+from pint import UndefinedUnitError
 
 from guardian.shortcuts import get_objects_for_user, get_anonymous_user
 
@@ -48,7 +49,7 @@ from ..usage_stats.utils import increase_statistics_by_date_and_object
 from ..plots import configure_plot
 from .models import Analysis, AnalysisFunction, AnalysisCollection, CARD_VIEW_FLAVORS, ImplementationMissingException
 from .forms import FunctionSelectForm
-from .utils import get_latest_analyses, round_to_significant_digits, request_analysis
+from .utils import get_latest_analyses, round_to_significant_digits, request_analysis, unit_conversion_factor
 
 import logging
 
@@ -286,15 +287,20 @@ class SimpleCardView(TemplateView):
         # Determine status code of request - do we need to trigger request again?
         #
         analyses_ready = analyses_avail.filter(task_state__in=['su', 'fa'])
-        analyses_unready = analyses_avail.filter(~Q(id__in=analyses_ready))
+        analyses_unready = analyses_avail.filter(~Q(id__in=analyses_ready))\
+            .select_related('function', 'subject_type').prefetch_related('subject')
 
         #
         # collect lists of successful analyses and analyses with failures
         #
         # Only the successful ones should show up in the plot
-        # the ones with failure should be shown elsewhere
-        analyses_success = analyses_ready.filter(task_state='su')
-        analyses_failure = analyses_ready.filter(task_state='fa')
+        # the ones with failure should be shown elsewhere.
+        # Function, subject type and subject are needed for every analysis shown on the card,
+        # so they are fetched together with the analyses.
+        analyses_success = analyses_ready.filter(task_state='su')\
+            .select_related('function', 'subject_type').prefetch_related('subject')
+        analyses_failure = analyses_ready.filter(task_state='fa')\
+            .select_related('function', 'subject_type').prefetch_related('subject')
 
         #
         # comprise context for analysis result card
@@ -414,8 +420,6 @@ class PlotCardView(SimpleCardView):
         xunit = first_analysis_result['xunit'] if 'xunit' in first_analysis_result else None
         yunit = first_analysis_result['yunit'] if 'yunit' in first_analysis_result else None
 
-        ureg = UnitRegistry()  # for unit conversion for each analysis individually, see below
-
         #
         # set xrange, yrange -> automatic bounds for zooming
         #
@@ -504,7 +508,8 @@ class PlotCardView(SimpleCardView):
             if analysis.task_state == analysis.FAILURE:
                 continue  # should not happen if only called with successful analyses
             elif analysis.task_state == analysis.SUCCESS:
-                series = analysis.result_obj['series']
+                analysis_result = analysis.result_obj  # unpickles, so only once per analysis
+                series = analysis_result['series']
             else:
                 # not ready yet
                 continue  # should not happen if only called with successful analyses
@@ -512,13 +517,12 @@ class PlotCardView(SimpleCardView):
             #
             # find out scale for data
             #
-            analysis_result = analysis.result_obj
 
             if xunit is None:
                 analysis_xscale = 1
             else:
                 try:
-                    analysis_xscale = ureg.convert(1, analysis_result['xunit'], xunit)
+                    analysis_xscale = unit_conversion_factor(analysis_result['xunit'], xunit)
                 except UndefinedUnitError as exc:
                     _log.error("Cannot convert units when displaying results for analysis with id %s. Cause: %s",
                                analysis.id, str(exc))
@@ -528,7 +532,7 @@ class PlotCardView(SimpleCardView):
                 analysis_yscale = 1
             else:
                 try:
-                    analysis_yscale = ureg.convert(1, analysis_result['yunit'], yunit)
+                    analysis_yscale = unit_conversion_factor(analysis_result['yunit'], yunit)
                 except UndefinedUnitError as exc:
                     _log.error("Cannot convert units when displaying results for analysis with id %s. Cause: %s",
                                analysis.id, str(exc))
@@ -636,8 +640,8 @@ class PlotCardView(SimpleCardView):
             #
             # Collect special values to be shown in the result card
             #
-            if 'scalars' in analysis.result_obj:
-                for scalar_name, scalar_dict in analysis.result_obj['scalars'].items():
+            if 'scalars' in analysis_result:
+                for scalar_name, scalar_dict in analysis_result['scalars'].items():
                     try:
                         scalar_unit = scalar_dict['unit']
                         if scalar_unit == '1':
@@ -1183,6 +1187,7 @@ def _contact_mechanics_distribution_figure(values, x_axis_label, y_axis_label,
     return p
 
 
+@transaction.non_atomic_requests
 def contact_mechanics_data(request):
     """Loads extra data for an analysis card
 
@@ -1228,7 +1233,8 @@ def contact_mechanics_data(request):
             #
             # Here we assume a special format for the analysis results
             #
-            data_path = analysis.result_obj['data_paths'][index]
+            analysis_result = analysis.result_obj
+            data_path = analysis_result['data_paths'][index]
 
             data = default_storage.open(data_path)
             ds = xr.load_dataset(data.open(mode='rb'))
@@ -1245,7 +1251,7 @@ def contact_mechanics_data(request):
             #
 
             patch_ids = assign_patch_numbers(contacting_points)[1]
-            contact_areas = patch_areas(patch_ids) * analysis.result_obj['area_per_pt']
+            contact_areas = patch_areas(patch_ids) * analysis_result['area_per_pt']
 
             #
             # Common figure parameters
@@ -3,6 +3,7 @@ from django.conf import settings
 from django.shortcuts import reverse
 import django
 
+from functools import lru_cache
 import json
 import bokeh
 import celery
@@ -16,10 +17,11 @@ from topobank.manager.utils import current_selection_as_basket_items
 UNSELECT_ALL_URL = reverse('manager:unselect-all')
 
 
-def versions_processor(request):
-
+@lru_cache(maxsize=None)
+def _versions():
+    """Return versions of main dependencies, they don't change while the process runs."""
     # key 'links': dicts with keys display_name:url
-    versions = [
+    return [
         dict(module='TopoBank',
              version=settings.TOPOBANK_VERSION,
              links={'Website':'https://github.com/ComputationalMechanics/TopoBank',
@@ -57,7 +59,10 @@ def versions_processor(request):
              links={'Website': 'https://bokeh.pydata.org/en/latest/'}),
     ]
 
-    return dict(versions=versions, contact_email_address=settings.CONTACT_EMAIL_ADDRESS)
+
+def versions_processor(request):
+    return dict(versions=_versions(), contact_email_address=settings.CONTACT_EMAIL_ADDRESS,
+                orcid_enabled=settings.ORCID_ENABLED)
 
 
 def basket_processor(request):
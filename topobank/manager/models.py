@@ -18,11 +18,6 @@ import math
 import logging
 import io
 
-from bokeh.models import DataRange1d, LinearColorMapper, ColorBar, FuncTickFormatter
-from bokeh.plotting import figure
-from bokeh.io.export import get_screenshot_as_png
-
-from ..plots import configure_plot
 from .utils import get_topography_reader, get_firefox_webdriver
 
 from topobank.users.models import User
@@ -616,6 +611,11 @@ class Topography(models.Model, SubjectMixin):
         :param st_topo: SurfaceTopography.Topography instance
         :return: bokeh plot
         """
+        # bokeh is only needed for plotting, so don't import it on app loading
+        from bokeh.models import DataRange1d, FuncTickFormatter
+        from bokeh.plotting import figure
+        from ..plots import configure_plot
+
         x, y = st_topo.positions_and_heights()
 
         x_range = DataRange1d(bounds='auto')
@@ -683,6 +683,10 @@ class Topography(models.Model, SubjectMixin):
         :param st_topo: SurfaceTopography.Topography instance
         :return: bokeh plot
         """
+        from bokeh.models import DataRange1d, LinearColorMapper, ColorBar, FuncTickFormatter
+        from bokeh.plotting import figure
+        from ..plots import configure_plot
+
         heights = st_topo.heights()
 
         topo_size = st_topo.physical_sizes
@@ -766,6 +770,8 @@ class Topography(models.Model, SubjectMixin):
         None
 
         """
+        from bokeh.io.export import get_screenshot_as_png
+
         plot = self.get_plot(thumbnail=True)
         #
         # Create a plot and save a thumbnail image in in-memory file
@@ -10,4 +10,4 @@ def render_license_urls(license_choice):
     """
     license_info = settings.CC_LICENSE_INFOS[license_choice]
 
-    return license_info
+    return dict(license_info)  # settings are read-only, the template context may be changed
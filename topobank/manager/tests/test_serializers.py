@@ -33,54 +33,36 @@ def test_surface_serializer(rf):
     #
     user_url = request.build_absolute_uri(user.get_absolute_url())
     surface1_prefix = f"/manager/surface/{surface1.pk}/"
-    topo1a_prefix = f"/manager/topography/{topo1a.pk}/"
-    topo1b_prefix = f"/manager/topography/{topo1b.pk}/"
-
-    topo1a_analyze = f"/analysis/topography/{topo1a.pk}/"
-    topo1b_analyze = f"/analysis/topography/{topo1b.pk}/"
     surface1_analyze = f"/analysis/surface/{surface1.pk}/"
 
+    def expected_topography(topo, selected):
+        """The serialized topographies only differ in these values."""
+        topo_prefix = f"/manager/topography/{topo.pk}/"
+        return {'creator': user_url,
+                'description': '',
+                'folder': False,
+                'key': f'topography-{topo.pk}',
+                'surface_key': f'surface-{surface1.pk}',
+                'name': topo.name,
+                'pk': topo.pk,
+                'selected': selected,
+                'tags': [],
+                'title': topo.name,
+                'type': 'topography',
+                'version': '',
+                'urls': {'delete': topo_prefix + 'delete/',
+                         'detail': topo_prefix,
+                         'select': topo_prefix + 'select/',
+                         'analyze': f"/analysis/topography/{topo.pk}/",
+                         'unselect': topo_prefix + 'unselect/',
+                         'update': topo_prefix + 'update/'}}
+
     assert result[0] == {
 
         'category': None,
         'children': [
-            {'creator': user_url,
-             'description': '',
-             'folder': False,
-             'key': f'topography-{topo1a.pk}',
-             'surface_key': f'surface-{surface1.pk}',
-             'name': topo1a.name,
-             'pk': topo1a.pk,
-             'selected': True,
-             'tags': [],
-             'title': topo1a.name,
-             'type': 'topography',
-             'version': '',
-             'urls': {'delete': topo1a_prefix + 'delete/',
-                      'detail': topo1a_prefix,
-                      'select': topo1a_prefix + 'select/',
-                      'analyze': topo1a_analyze,
-                      'unselect': topo1a_prefix + 'unselect/',
-                      'update': topo1a_prefix + 'update/'}},
-            {'creator': user_url,
-             'description': '',
-             'folder': False,
-             'key': f'topography-{topo1b.pk}',
-             'surface_key': f'surface-{surface1.pk}',
-             'name': topo1b.name,
-             'pk': topo1b.pk,
-             'selected': False,
-             'tags': [],
-             'title': topo1b.name,
-             'type': 'topography',
-             'version': '',
-             'urls': {'delete': topo1b_prefix + 'delete/',
-                      'detail': topo1b_prefix,
-                      'select': topo1b_prefix + 'select/',
-                      'analyze': topo1b_analyze,
-                      'unselect': topo1b_prefix + 'unselect/',
-                      'update': topo1b_prefix + 'update/'}},
-
+            expected_topography(topo1a, selected=True),
+            expected_topography(topo1b, selected=False),
         ],
         'creator': user_url,
         'description': '',
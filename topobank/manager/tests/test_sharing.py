@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
 import datetime
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.shortcuts import reverse
 from bs4 import BeautifulSoup
 from notifications.models import Notification
@@ -14,12 +15,8 @@ def test_individual_read_access_permissions(client, django_user_model, handle_us
     #
     # create database objects
     #
-    username_1 = 'A'
-    username_2 = 'B'
-    password = 'secret'
-
-    user_1 = django_user_model.objects.create_user(username=username_1, password=password)
-    user_2 = django_user_model.objects.create_user(username=username_2, password=password)
+    user_1 = django_user_model.objects.create_user(username='A')
+    user_2 = django_user_model.objects.create_user(username='B')
 
     surface = SurfaceFactory(creator=user_1)
 
@@ -29,7 +26,7 @@ def test_individual_read_access_permissions(client, django_user_model, handle_us
     #
     # now user 1 has access to surface detail page
     #
-    assert client.login(username=username_1, password=password)
+    client.force_login(user_1)
     response = client.get(surface_detail_url)
 
     assert response.status_code == 200
@@ -39,7 +36,7 @@ def test_individual_read_access_permissions(client, django_user_model, handle_us
     #
     # User 2 has no access
     #
-    assert client.login(username=username_2, password=password)
+    client.force_login(user_2)
     response = client.get(surface_detail_url)
 
     assert response.status_code == 403 # forbidden
@@ -54,7 +51,7 @@ def test_individual_read_access_permissions(client, django_user_model, handle_us
 
     assign_perm('view_surface', user_2, surface)
 
-    assert client.login(username=username_2, password=password)
+    client.force_login(user_2)
     response = client.get(surface_detail_url)
 
     assert response.status_code == 200  # now it's okay
@@ -75,9 +72,7 @@ def test_list_surface_permissions(client, handle_usage_statistics):
     #
     # create database objects
     #
-    password = 'secret'
-
-    user1 = UserFactory(password=password)
+    user1 = UserFactory()
     user2 = UserFactory(name="Bob Marley")
     user3 = UserFactory(name="Alice Cooper")
 
@@ -90,7 +85,7 @@ def test_list_surface_permissions(client, handle_usage_statistics):
     #
     # now user 1 has access to surface detail page
     #
-    assert client.login(username=user1.username, password=password)
+    client.force_login(user1)
     response = client.get(surface_detail_url)
 
     assert_in_content(response, "Permissions")
@@ -555,29 +550,26 @@ def test_upload_topography_for_shared_surface(client, handle_usage_statistics):
     input_file_path = Path(FIXTURE_DIR+'/example3.di')
     description = "test description"
 
-    password = 'abcd$1234'
-
-    user1 = UserFactory(password=password)
-    user2 = UserFactory(password=password)
+    user1 = UserFactory()
+    user2 = UserFactory()
 
     surface = SurfaceFactory(creator=user1)
     surface.share(user2) # first without allowing change
 
 
-    assert client.login(username=user2.username, password=password)
+    client.force_login(user2)
 
     #
     # open first step of wizard: file upload
     #
-    with open(str(input_file_path), mode='rb') as fp:
-
-        response = client.post(reverse('manager:topography-create',
-                                       kwargs=dict(surface_id=surface.id)),
-                               data={
-                                'topography_create_wizard-current_step': 'upload',
-                                'upload-datafile': fp,
-                                'upload-surface': surface.id,
-                               }, follow=True)
+    # The permission is checked before the form is processed, so no file
+    # needs to be sent here
+    response = client.post(reverse('manager:topography-create',
+                                   kwargs=dict(surface_id=surface.id)),
+                           data={
+                            'topography_create_wizard-current_step': 'upload',
+                            'upload-surface': surface.id,
+                           }, follow=True)
 
     assert response.status_code == 403 # user2 is not allowed to change
 
@@ -586,14 +578,14 @@ def test_upload_topography_for_shared_surface(client, handle_usage_statistics):
     #
     surface.share(user2, allow_change=True)
 
-    with open(str(input_file_path), mode='rb') as fp:
-        response = client.post(reverse('manager:topography-create',
-                                       kwargs=dict(surface_id=surface.id)),
-                               data={
-                                   'topography_create_wizard-current_step': 'upload',
-                                   'upload-datafile': fp,
-                                   'upload-surface': surface.id,
-                               }, follow=True)
+    response = client.post(reverse('manager:topography-create',
+                                   kwargs=dict(surface_id=surface.id)),
+                           data={
+                               'topography_create_wizard-current_step': 'upload',
+                               'upload-datafile': SimpleUploadedFile(input_file_path.name,
+                                                                     input_file_path.read_bytes()),
+                               'upload-surface': surface.id,
+                           }, follow=True)
 
     assert response.status_code == 200
 
@@ -671,7 +663,7 @@ def test_upload_topography_for_shared_surface(client, handle_usage_statistics):
     assert_in_content(response, 'uploaded by you')
 
     client.logout()
-    assert client.login(username=user1.username, password=password)
+    client.force_login(user1)
     response = client.get(reverse('manager:topography-detail', kwargs=dict(pk=t.pk)))
     assert response.status_code == 200
 
@@ -10,10 +10,6 @@ import traceback
 import logging
 import json
 
-from selenium import webdriver
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.firefox.firefox_binary import FirefoxBinary
-
 from SurfaceTopography import open_topography
 from SurfaceTopography.IO import readers as surface_topography_readers
 
@@ -824,7 +820,18 @@ def get_tree_mode(request) -> str:
     return tree_mode
 
 
-def get_firefox_webdriver() -> WebDriver:
+def get_firefox_webdriver():
+    """Return a headless firefox instance, e.g. for creating thumbnails.
+
+    Selenium is imported here and not on module level,
+    because it is only needed when generating thumbnails.
+
+    Returns
+    -------
+    selenium.webdriver.remote.webdriver.WebDriver
+    """
+    from selenium import webdriver
+    from selenium.webdriver.firefox.firefox_binary import FirefoxBinary
 
     binary = FirefoxBinary(str(settings.FIREFOX_BINARY_PATH))
 
@@ -20,6 +20,7 @@ from django.core.exceptions import PermissionDenied
 from django.core.files import File
 from django.core.files.storage import FileSystemStorage
 from django.core.files.storage import default_storage
+from django.db import transaction
 from django.db.models import Q
 from django.http import HttpResponse, Http404
 from django.shortcuts import redirect, render
@@ -1577,6 +1578,7 @@ class SurfaceSearchPaginator(PageNumberPagination):
         return urls
 
 
+@method_decorator(transaction.non_atomic_requests, name='dispatch')
 class TagTreeView(ListAPIView):
     """
     Generate tree of tags with surfaces and topographies underneath.
@@ -1612,6 +1614,7 @@ class TagTreeView(ListAPIView):
         return context
 
 
+@method_decorator(transaction.non_atomic_requests, name='dispatch')
 class SurfaceListView(ListAPIView):
     """
     List all surfaces with topographies underneath.
@@ -1838,6 +1841,7 @@ def unselect_all(request):
     return Response([])
 
 
+@transaction.non_atomic_requests
 def thumbnail(request, pk):
     """Returns image data for a topography thumbail
 
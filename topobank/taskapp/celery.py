@@ -23,7 +23,10 @@ class CeleryAppConfig(AppConfig):
         # pickle the object when using Windows.
         app.config_from_object('django.conf:settings', namespace='CELERY')
         installed_apps = [app_config.name for app_config in apps.get_app_configs()]
-        app.autodiscover_tasks(lambda: installed_apps, force=True)
+        # Without 'force', the tasks modules are only imported when the app
+        # is finalized, i.e. when a worker starts or tasks are used first,
+        # and not in every process which loads the Django app registry
+        app.autodiscover_tasks(lambda: installed_apps)
 
         #
         # I had problems using the celery signal 'on_after_configure'.
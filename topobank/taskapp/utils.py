@@ -1,3 +1,4 @@
+from functools import lru_cache
 import importlib
 
 from topobank.analysis.models import Configuration, Dependency, Version
@@ -5,8 +6,12 @@ from topobank.analysis.models import Configuration, Dependency, Version
 class ConfigurationException(Exception):
     pass
 
+@lru_cache(maxsize=None)
 def get_package_version_tuple(pkg_name, version_expr):
-    """
+    """Return version tuple of an installed package.
+
+    The result is cached, because installed versions do not change
+    while a process is running.
 
     :param pkg_name: name of the package which is used in import statement
     :param version_expr: expression used to get the version from already imported module
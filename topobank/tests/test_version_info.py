@@ -0,0 +1,7 @@
+import topobank
+
+
+def test_version_info_matches_version():
+    expected = tuple(int(num) if num.isdigit() else num
+                     for num in topobank.__version__.replace("-", ".", 1).split("."))
+    assert topobank.__version_info__ == expected
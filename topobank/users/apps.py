@@ -11,4 +11,10 @@ class UsersAppConfig(AppConfig):
         """
         import topobank.users.signals
 
+        # Django caches the validator instances from AUTH_PASSWORD_VALIDATORS,
+        # create them now, so e.g. the list of common passwords is not read
+        # on the first password check of each worker process
+        from django.contrib.auth.password_validation import get_default_password_validators
+        get_default_password_validators()
+
 
@@ -23,5 +23,20 @@ def test_terms_conditions_as_anonymous(client):
     assert_in_content(response, "some text")
 
 
+@pytest.mark.parametrize('orcid_enabled', [True, False])
+@pytest.mark.django_db
+def test_orcid_login_link_for_anonymous(client, settings, orcid_enabled, handle_usage_statistics):
+    # With DJANGO_ORCID_ENABLED=False the ORCID provider app is not installed,
+    # so the templates must not ask for its login URL
+    settings.ORCID_ENABLED = orcid_enabled
 
+    TermsAndConditions.objects.create(slug='test-terms', name="Test of T&amp;C",
+                                      text="some text", date_active=timezone.now())
 
+    for url in [reverse('home'), reverse('terms')]:
+        response = client.get(url)
+        assert response.status_code == 200
+        if orcid_enabled:
+            assert_in_content(response, "/accounts/orcid/login/")
+        else:
+            assert_not_in_content(response, "/accounts/orcid/login/")